@@ -1,13 +1,144 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
 from datetime import datetime
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, RowMapping, bindparam, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, load_only, selectinload
 
+from backend.app.core.cache import TTLCache, restore_row, snapshot_row
+from backend.app.core.config import settings
 from backend.app.core.security import encrypt, decrypt
 from backend.app.models.bank import BankAccount, Transaction
 from backend.app.schemas.bank import BankAccountCreate, BankAccountUpdate, TransactionCreate, TransactionUpdate
 
 
+# Maximum number of values bound into a single IN clause (older SQLite builds cap at 999)
+IN_CLAUSE_BATCH_SIZE = 500
+
+# Dialect INSERT constructs supporting ON CONFLICT DO UPDATE, used by upsert_bank_accounts
+UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+# Columns refreshed when an already linked bank account is linked again
+UPSERT_BANK_ACCOUNT_COLUMNS = (
+    "account_name",
+    "institution",
+    "account_type",
+    "currency",
+    "balance",
+    "available_balance",
+    "access_token",
+    "refresh_token",
+    "token_expires_at",
+    "is_active",
+)
+
+
+# Prebuilt statements for the hot single-row lookups, compiled once per process
+SELECT_BANK_ACCOUNT_BY_ID = select(BankAccount).where(BankAccount.id == bindparam("bank_account_id"))
+# account_id is only unique per user, so the earliest link wins when several users share one
+SELECT_BANK_ACCOUNT_BY_ACCOUNT_ID = (
+    select(BankAccount)
+    .where(BankAccount.account_id == bindparam("account_id"))
+    .order_by(BankAccount.id)
+    .limit(1)
+)
+SELECT_USER_BANK_ACCOUNT_BY_ACCOUNT_ID = SELECT_BANK_ACCOUNT_BY_ACCOUNT_ID.where(
+    BankAccount.user_id == bindparam("user_id")
+)
+SELECT_BANK_ACCOUNT_TOKENS = select(
+    BankAccount.id,
+    BankAccount.access_token,
+    BankAccount.refresh_token,
+    BankAccount.token_expires_at
+).where(BankAccount.id == bindparam("bank_account_id"))
+# Account listing: only the columns the API schema returns, in primary key order
+SELECT_USER_BANK_ACCOUNTS = (
+    select(BankAccount)
+    .options(
+        load_only(
+            BankAccount.id,
+            BankAccount.user_id,
+            BankAccount.account_id,
+            BankAccount.account_name,
+            BankAccount.institution,
+            BankAccount.account_type,
+            BankAccount.currency,
+            BankAccount.balance,
+            BankAccount.available_balance,
+            BankAccount.is_active,
+            BankAccount.last_synced,
+            BankAccount.created_at,
+            BankAccount.updated_at,
+        )
+    )
+    .where(BankAccount.user_id == bindparam("user_id"))
+    .order_by(BankAccount.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+# Plain transaction rows for the read-only history endpoint, newest first
+SELECT_TRANSACTION_ROWS_BY_BANK_ACCOUNT = (
+    select(*Transaction.__table__.columns)
+    .where(Transaction.bank_account_id == bindparam("bank_account_id"))
+    .order_by(Transaction.date.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+SELECT_TRANSACTION_BY_ID = select(Transaction).where(Transaction.id == bindparam("transaction_id"))
+SELECT_TRANSACTION_BY_TRANSACTION_ID = (
+    select(Transaction).where(Transaction.transaction_id == bindparam("transaction_id")).limit(1)
+)
+
+# Read-through cache of account listings (by user ID)
+user_bank_accounts_cache = TTLCache(maxsize=1024, ttl=settings.CACHE_TTL_SECONDS)
+
+# Decrypted tokens by bank account ID, never kept past the access token's expiry
+decrypted_token_cache = TTLCache(maxsize=1024, ttl=settings.TOKEN_CACHE_TTL_SECONDS)
+
+
+def _invalidate_bank_account_cache(user_id: int) -> None:
+    """Drop cached reads affected by a write to one of a user's bank accounts."""
+    user_bank_accounts_cache.delete(user_id)
+
+
+def _get_token_row(db: Session, bank_account_id: int) -> Optional[Row]:
+    """Fetch only the columns needed to decrypt a bank account's tokens."""
+    return db.execute(SELECT_BANK_ACCOUNT_TOKENS, {"bank_account_id": bank_account_id}).first()
+
+
+def _decrypt_tokens(db_bank_account: Union[BankAccount, Row]) -> Dict[str, str]:
+    """Decrypt a bank account's tokens, reusing the result while the ciphertext is unchanged."""
+    ciphertexts = (db_bank_account.access_token, db_bank_account.refresh_token)
+    cached = decrypted_token_cache.get(db_bank_account.id)
+    if cached is not None and cached[0] == ciphertexts:
+        return cached[1]
+    
+    tokens = {
+        "access_token": decrypt(db_bank_account.access_token),
+        "refresh_token": decrypt(db_bank_account.refresh_token)
+    }
+    
+    ttl = None
+    if db_bank_account.token_expires_at:
+        ttl = min(
+            decrypted_token_cache.ttl,
+            (db_bank_account.token_expires_at - datetime.utcnow()).total_seconds()
+        )
+    if ttl is None or ttl > 0:
+        decrypted_token_cache.set(db_bank_account.id, (ciphertexts, tokens), ttl=ttl)
+    return tokens
+
+
+def _batched(values: Sequence[Any], size: int = IN_CLAUSE_BATCH_SIZE) -> Iterator[Sequence[Any]]:
+    """Yield successive slices of at most `size` values."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
 def get_bank_account(db: Session, bank_account_id: int) -> Optional[BankAccount]:
     """
     Get a bank account by ID.
@@ -24,7 +155,7 @@ def get_bank_account(db: Session, bank_account_id: int) -> Optional[BankAccount]
     Optional[BankAccount]
         Bank account object if found, None otherwise
     """
-    return db.query(BankAccount).filter(BankAccount.id == bank_account_id).first()
+    return db.scalars(SELECT_BANK_ACCOUNT_BY_ID, {"bank_account_id": bank_account_id}).first()
 
 
 def update_last_synced(db: Session, db_bank_account: BankAccount) -> BankAccount:
@@ -43,20 +174,15 @@ def update_last_synced(db: Session, db_bank_account: BankAccount) -> BankAccount
     BankAccount
         Updated bank account
     """
-    # Update the last sync time
-    db_bank_account.last_synced = datetime.utcnow()
-
-    # Commit the changes
-    db.add(db_bank_account)
-    db.commit()
-    db.refresh(db_bank_account)
-
-    return db_bank_account
+    return update_bank_account_sync_time(db, db_bank_account)
 
 def get_bank_account_by_account_id(db: Session, account_id: str) -> Optional[BankAccount]:
     """
     Get a bank account by account ID (from the provider).
     
+    The same TrueLayer account can be linked by several users; the earliest
+    linked row is returned.
+    
     Parameters:
     -----------
     db: Session
@@ -69,10 +195,43 @@ def get_bank_account_by_account_id(db: Session, account_id: str) -> Optional[Ban
     Optional[BankAccount]
         Bank account object if found, None otherwise
     """
-    return db.query(BankAccount).filter(BankAccount.account_id == account_id).first()
+    return db.scalars(SELECT_BANK_ACCOUNT_BY_ACCOUNT_ID, {"account_id": account_id}).first()
+
+
+def get_bank_account_for_user(
+    db: Session, account_id: str, user_id: int, allow_superuser: bool = False
+) -> Optional[BankAccount]:
+    """
+    Get a bank account by account ID (from the provider) if the user may access it.
+    
+    Parameters:
+    -----------
+    db: Session
+        Database session
+    account_id: str
+        Account ID from the provider
+    user_id: int
+        ID of the user requesting the account
+    allow_superuser: bool
+        Whether the user is a superuser and may access any account; their own
+        link is preferred, otherwise the earliest link by any user is returned
+        
+    Returns:
+    --------
+    Optional[BankAccount]
+        Bank account object if found and accessible, None otherwise
+    """
+    db_bank_account = db.scalars(
+        SELECT_USER_BANK_ACCOUNT_BY_ACCOUNT_ID, {"account_id": account_id, "user_id": user_id}
+    ).first()
+    if db_bank_account is None and allow_superuser:
+        return get_bank_account_by_account_id(db, account_id=account_id)
+    return db_bank_account
 
 
-def get_user_bank_accounts(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[BankAccount]:
+def get_user_bank_accounts(
+    db: Session, user_id: int, skip: int = 0, limit: int = 100, include_transactions: bool = False
+) -> List[BankAccount]:
     """
     Get bank accounts for a user with pagination.
     
@@ -86,13 +245,29 @@ def get_user_bank_accounts(db: Session, user_id: int, skip: int = 0, limit: int
         Number of records to skip
     limit: int
         Maximum number of records to return
+    include_transactions: bool
+        Eagerly load each account's transactions in one extra query
         
     Returns:
     --------
     List[BankAccount]
         List of bank accounts
     """
-    return db.query(BankAccount).filter(BankAccount.user_id == user_id).offset(skip).limit(limit).all()
+    params = {"user_id": user_id, "skip": skip, "limit": limit}
+    if include_transactions:
+        statement = SELECT_USER_BANK_ACCOUNTS.options(selectinload(BankAccount.transactions))
+        return db.scalars(statement, params).all()
+    
+    pages = user_bank_accounts_cache.get(user_id, {})
+    cached = pages.get((skip, limit))
+    if cached is not None:
+        return [restore_row(db, BankAccount, values) for values in cached]
+    
+    bank_accounts = db.scalars(SELECT_USER_BANK_ACCOUNTS, params).all()
+    user_bank_accounts_cache.set(
+        user_id, {**pages, (skip, limit): [snapshot_row(account) for account in bank_accounts]}
+    )
+    return bank_accounts
 
 
 def create_bank_account(db: Session, bank_account_in: BankAccountCreate) -> BankAccount:
@@ -112,39 +287,111 @@ def create_bank_account(db: Session, bank_account_in: BankAccountCreate) -> Bank
         Created bank account
     """
     # Encrypt sensitive data
-    access_token_encrypted = encrypt(bank_account_in.access_token)
-    refresh_token_encrypted = encrypt(bank_account_in.refresh_token)
-    
-    # Create the bank account object
-    db_bank_account = BankAccount(
-        user_id=bank_account_in.user_id,
-        account_id=bank_account_in.account_id,
-        provider_id=bank_account_in.provider_id,
-        account_type=bank_account_in.account_type,
-        account_name=bank_account_in.account_name,
-        account_number=bank_account_in.account_number,
-        sort_code=bank_account_in.sort_code,
-        iban=bank_account_in.iban,
-        institution=bank_account_in.institution,
-        currency=bank_account_in.currency,
-        country=bank_account_in.country,
-        access_token=access_token_encrypted,
-        refresh_token=refresh_token_encrypted,
-        token_expiry=bank_account_in.token_expiry,
-        balance=bank_account_in.balance,
-        available_balance=bank_account_in.available_balance,
-        is_active=bank_account_in.is_active,
-        is_connected=bank_account_in.is_connected
-    )
-    
-    # Add to the database and commit
-    db.add(db_bank_account)
+    values = bank_account_in.model_dump()
+    values["access_token"] = encrypt(bank_account_in.access_token)
+    values["refresh_token"] = encrypt(bank_account_in.refresh_token)
+    
+    # Insert the row and read it back in the same round-trip
+    db_bank_account = db.scalars(
+        insert(BankAccount).values(**values).returning(BankAccount)
+    ).one()
     db.commit()
-    db.refresh(db_bank_account)
+    _invalidate_bank_account_cache(bank_account_in.user_id)
     
     return db_bank_account
 
 
+def _upsert_bank_accounts_by_lookup(db: Session, rows: List[Dict[str, Any]]) -> List[BankAccount]:
+    """Upsert bank accounts with batched lookups, for dialects without ON CONFLICT."""
+    account_ids_by_user: Dict[int, List[str]] = {}
+    for values in rows:
+        account_ids_by_user.setdefault(values["user_id"], []).append(values["account_id"])
+    
+    # Find the accounts each user has already linked
+    existing = {}
+    for user_id, account_ids in account_ids_by_user.items():
+        for batch in _batched(account_ids):
+            for db_bank_account in db.scalars(
+                select(BankAccount).where(
+                    BankAccount.user_id == user_id,
+                    BankAccount.account_id.in_(batch)
+                )
+            ):
+                existing[(user_id, db_bank_account.account_id)] = db_bank_account
+    
+    # Refresh the existing accounts and add the new ones
+    bank_accounts = []
+    for values in rows:
+        db_bank_account = existing.get((values["user_id"], values["account_id"]))
+        if db_bank_account is None:
+            db_bank_account = BankAccount(**values)
+            db.add(db_bank_account)
+        else:
+            for column in UPSERT_BANK_ACCOUNT_COLUMNS:
+                setattr(db_bank_account, column, values[column])
+        bank_accounts.append(db_bank_account)
+    db.flush()
+    
+    return bank_accounts
+
+
+def upsert_bank_accounts(db: Session, bank_accounts_in: List[BankAccountCreate]) -> List[BankAccount]:
+    """
+    Create bank accounts, or refresh them if the user has already linked the TrueLayer account.
+    
+    On PostgreSQL and SQLite all accounts are written with a single
+    INSERT ... ON CONFLICT (user_id, account_id) DO UPDATE statement; other
+    dialects fall back to batched lookups followed by inserts and updates.
+    
+    Parameters:
+    -----------
+    db: Session
+        Database session
+    bank_accounts_in: List[BankAccountCreate]
+        Bank account creation data
+        
+    Returns:
+    --------
+    List[BankAccount]
+        Created or updated bank accounts
+    """
+    if not bank_accounts_in:
+        return []
+    
+    # Encrypt sensitive data, keeping the last entry for each (user, TrueLayer account)
+    rows_by_key = {}
+    for bank_account_in in bank_accounts_in:
+        values = bank_account_in.model_dump()
+        values["access_token"] = encrypt(bank_account_in.access_token)
+        values["refresh_token"] = encrypt(bank_account_in.refresh_token)
+        rows_by_key[(values["user_id"], values["account_id"])] = values
+    rows = list(rows_by_key.values())
+    
+    dialect_insert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is None:
+        bank_accounts = _upsert_bank_accounts_by_lookup(db, rows)
+    else:
+        # Insert new accounts and update existing ones in the same statement
+        statement = dialect_insert(BankAccount).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=[BankAccount.user_id, BankAccount.account_id],
+            set_={
+                **{column: statement.excluded[column] for column in UPSERT_BANK_ACCOUNT_COLUMNS},
+                "updated_at": func.now(),
+            },
+        ).returning(BankAccount)
+        bank_accounts = db.scalars(statement).all()
+    
+    # Capture the keys before the commit expires the objects
+    keys = [(bank_account.id, bank_account.user_id) for bank_account in bank_accounts]
+    db.commit()
+    for bank_account_id, user_id in keys:
+        _invalidate_bank_account_cache(user_id)
+        decrypted_token_cache.delete(bank_account_id)
+    
+    return bank_accounts
+
+
 def update_bank_account(db: Session, db_bank_account: BankAccount, bank_account_in: Union[BankAccountUpdate, Dict[str, Any]]) -> BankAccount:
     """
     Update a bank account.
@@ -164,7 +411,7 @@ def update_bank_account(db: Session, db_bank_account: BankAccount, bank_account_
         Updated bank account
     """
     # Convert to dict if not already
-    update_data = bank_account_in if isinstance(bank_account_in, dict) else bank_account_in.dict(exclude_unset=True)
+    update_data = bank_account_in if isinstance(bank_account_in, dict) else bank_account_in.model_dump(exclude_unset=True)
     
     # Encrypt sensitive data if present
     if "access_token" in update_data and update_data["access_token"]:
@@ -178,9 +425,11 @@ def update_bank_account(db: Session, db_bank_account: BankAccount, bank_account_
         setattr(db_bank_account, field, value)
     
     # Commit the changes
+    bank_account_id, user_id = db_bank_account.id, db_bank_account.user_id
     db.add(db_bank_account)
     db.commit()
-    db.refresh(db_bank_account)
+    _invalidate_bank_account_cache(user_id)
+    decrypted_token_cache.delete(bank_account_id)
     
     return db_bank_account
 
@@ -201,13 +450,16 @@ def update_bank_account_sync_time(db: Session, db_bank_account: BankAccount) ->
     BankAccount
         Updated bank account
     """
-    # Update the last sync time
-    db_bank_account.last_sync = datetime.utcnow()
-    
-    # Commit the changes
-    db.add(db_bank_account)
+    # Stamp the last sync time in a single UPDATE using the database clock
+    bank_account_id, user_id = db_bank_account.id, db_bank_account.user_id
+    db.execute(
+        update(BankAccount)
+        .where(BankAccount.id == bank_account_id)
+        .values(last_synced=func.now())
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
-    db.refresh(db_bank_account)
+    _invalidate_bank_account_cache(user_id)
     
     return db_bank_account
 
@@ -228,19 +480,20 @@ def delete_bank_account(db: Session, bank_account_id: int) -> Optional[BankAccou
     Optional[BankAccount]
         Deleted bank account if found, None otherwise
     """
-    # Get the bank account
-    db_bank_account = get_bank_account(db, bank_account_id=bank_account_id)
+    # Mark as inactive in a single UPDATE, returning the updated row
+    db_bank_account = db.scalars(
+        update(BankAccount)
+        .where(BankAccount.id == bank_account_id)
+        .values(is_active=False)
+        .returning(BankAccount)
+    ).one_or_none()
     if not db_bank_account:
         return None
     
-    # Mark as inactive
-    db_bank_account.is_active = False
-    db_bank_account.is_connected = False
-    
     # Commit the changes
-    db.add(db_bank_account)
+    user_id = db_bank_account.user_id
     db.commit()
-    db.refresh(db_bank_account)
+    _invalidate_bank_account_cache(user_id)
     
     return db_bank_account
 
@@ -261,19 +514,13 @@ def get_bank_account_tokens(db: Session, bank_account_id: int) -> Dict[str, str]
     Dict[str, str]
         Dictionary with access_token and refresh_token
     """
-    # Get the bank account
-    db_bank_account = get_bank_account(db, bank_account_id=bank_account_id)
+    # Get the encrypted tokens
+    db_bank_account = _get_token_row(db, bank_account_id=bank_account_id)
     if not db_bank_account:
         return {"access_token": "", "refresh_token": ""}
     
     # Decrypt the tokens
-    access_token = decrypt(db_bank_account.access_token)
-    refresh_token = decrypt(db_bank_account.refresh_token)
-    
-    return {
-        "access_token": access_token,
-        "refresh_token": refresh_token
-    }
+    return dict(_decrypt_tokens(db_bank_account))
 
 def get_decrypted_access_token(db: Session, bank_account_id: int) -> str:
     """
@@ -291,13 +538,13 @@ def get_decrypted_access_token(db: Session, bank_account_id: int) -> str:
     str
         Decrypted access token or empty string if not found
     """
-    # Get the bank account
-    db_bank_account = get_bank_account(db, bank_account_id=bank_account_id)
+    # Get the encrypted tokens
+    db_bank_account = _get_token_row(db, bank_account_id=bank_account_id)
     if not db_bank_account:
         return ""
     
     # Decrypt the access token
-    return decrypt(db_bank_account.access_token)
+    return _decrypt_tokens(db_bank_account)["access_token"]
 
 
 def get_decrypted_refresh_token(db: Session, bank_account_id: int) -> str:
@@ -316,13 +563,13 @@ def get_decrypted_refresh_token(db: Session, bank_account_id: int) -> str:
     str
         Decrypted refresh token or empty string if not found
     """
-    # Get the bank account
-    db_bank_account = get_bank_account(db, bank_account_id=bank_account_id)
+    # Get the encrypted tokens
+    db_bank_account = _get_token_row(db, bank_account_id=bank_account_id)
     if not db_bank_account:
         return ""
     
     # Decrypt the refresh token
-    return decrypt(db_bank_account.refresh_token)
+    return _decrypt_tokens(db_bank_account)["refresh_token"]
 
 def update_bank_account_tokens(db: Session, bank_account_id: int, access_token: str, refresh_token: str, token_expiry: Optional[datetime] = None) -> Optional[BankAccount]:
     """
@@ -357,12 +604,14 @@ def update_bank_account_tokens(db: Session, bank_account_id: int, access_token:
     
     # Update the token expiry
     if token_expiry:
-        db_bank_account.token_expiry = token_expiry
+        db_bank_account.token_expires_at = token_expiry
     
     # Commit the changes
+    user_id = db_bank_account.user_id
     db.add(db_bank_account)
     db.commit()
-    db.refresh(db_bank_account)
+    _invalidate_bank_account_cache(user_id)
+    decrypted_token_cache.delete(bank_account_id)
     
     return db_bank_account
 
@@ -385,7 +634,7 @@ def get_transaction(db: Session, transaction_id: int) -> Optional[Transaction]:
     Optional[Transaction]
         Transaction object if found, None otherwise
     """
-    return db.query(Transaction).filter(Transaction.id == transaction_id).first()
+    return db.scalars(SELECT_TRANSACTION_BY_ID, {"transaction_id": transaction_id}).first()
 
 
 def get_transaction_by_transaction_id(db: Session, transaction_id: str) -> Optional[Transaction]:
@@ -404,7 +653,7 @@ def get_transaction_by_transaction_id(db: Session, transaction_id: str) -> Optio
     Optional[Transaction]
         Transaction object if found, None otherwise
     """
-    return db.query(Transaction).filter(Transaction.transaction_id == transaction_id).first()
+    return db.scalars(SELECT_TRANSACTION_BY_TRANSACTION_ID, {"transaction_id": transaction_id}).first()
 
 def get_transactions_by_bank_account(
     db: Session, bank_account_id: int, skip: int = 0, limit: int = 100
@@ -437,7 +686,35 @@ def get_transactions_by_bank_account(
         .all()
     )
 
-def get_account_transactions(db: Session, account_id: int, skip: int = 0, limit: int = 100) -> List[Transaction]:
+def get_transaction_rows_by_bank_account(
+    db: Session, bank_account_id: int, skip: int = 0, limit: int = 100
+) -> Sequence[RowMapping]:
+    """
+    Get transactions by bank account ID as plain column mappings, without ORM objects.
+    
+    Parameters:
+    -----------
+    db: Session
+        Database session
+    bank_account_id: int
+        Bank account ID
+    skip: int
+        Number of records to skip
+    limit: int
+        Maximum number of records to return
+        
+    Returns:
+    --------
+    Sequence[RowMapping]
+        Transaction rows keyed by column name
+    """
+    params = {"bank_account_id": bank_account_id, "skip": skip, "limit": limit}
+    return db.execute(SELECT_TRANSACTION_ROWS_BY_BANK_ACCOUNT, params).mappings().all()
+
+
+def get_account_transactions(
+    db: Session, account_id: int, skip: int = 0, limit: int = 100, before: Optional[datetime] = None
+) -> List[Transaction]:
     """
     Get transactions for a bank account with pagination.
     
@@ -451,13 +728,18 @@ def get_account_transactions(db: Session, account_id: int, skip: int = 0, limit:
         Number of records to skip
     limit: int
         Maximum number of records to return
+    before: Optional[datetime]
+        Only return transactions dated before this time (keyset pagination)
         
     Returns:
     --------
     List[Transaction]
         List of transactions
     """
-    return db.query(Transaction).filter(Transaction.account_id == account_id).order_by(Transaction.date.desc()).offset(skip).limit(limit).all()
+    query = db.query(Transaction).filter(Transaction.bank_account_id == account_id)
+    if before is not None:
+        query = query.filter(Transaction.date < before)
+    return query.order_by(Transaction.date.desc()).offset(skip).limit(limit).all()
 
 
 def create_transaction(db: Session, transaction_in: TransactionCreate) -> Transaction:
@@ -481,25 +763,11 @@ def create_transaction(db: Session, transaction_in: TransactionCreate) -> Transa
     if existing_transaction:
         return existing_transaction
     
-    # Create the transaction object
-    db_transaction = Transaction(
-        account_id=transaction_in.account_id,
-        transaction_id=transaction_in.transaction_id,
-        transaction_category=transaction_in.transaction_category,
-        date=transaction_in.date,
-        description=transaction_in.description,
-        merchant=transaction_in.merchant,
-        amount=transaction_in.amount,
-        currency=transaction_in.currency,
-        category=transaction_in.category,
-        reference=transaction_in.reference,
-        metadata=transaction_in.metadata
-    )
-    
-    # Add to the database and commit
-    db.add(db_transaction)
+    # Insert the row and read it back in the same round-trip
+    db_transaction = db.scalars(
+        insert(Transaction).values(**transaction_in.model_dump()).returning(Transaction)
+    ).one()
     db.commit()
-    db.refresh(db_transaction)
     
     return db_transaction
 
@@ -523,7 +791,7 @@ def update_transaction(db: Session, db_transaction: Transaction, transaction_in:
         Updated transaction
     """
     # Convert to dict if not already
-    update_data = transaction_in if isinstance(transaction_in, dict) else transaction_in.dict(exclude_unset=True)
+    update_data = transaction_in if isinstance(transaction_in, dict) else transaction_in.model_dump(exclude_unset=True)
     
     # Update the transaction object
     for field, value in update_data.items():
@@ -537,6 +805,59 @@ def update_transaction(db: Session, db_transaction: Transaction, transaction_in:
     return db_transaction
 
 
+def create_missing_transactions(
+    db: Session, bank_account_id: int, transactions: List[Dict[str, Any]], commit: bool = True
+) -> int:
+    """
+    Insert the transactions that are not stored yet, leaving existing ones untouched.
+    
+    Parameters:
+    -----------
+    db: Session
+        Database session
+    bank_account_id: int
+        Bank account ID
+    transactions: List[Dict[str, Any]]
+        List of transaction data
+    commit: bool
+        Commit the insert; pass False to commit it together with a following write
+        
+    Returns:
+    --------
+    int
+        Number of transactions inserted
+    """
+    if not transactions:
+        return 0
+    
+    # Validate the incoming data, keyed by the provider transaction ID
+    rows = {}
+    for transaction_data in transactions:
+        transaction_in = TransactionCreate(**{**transaction_data, "bank_account_id": bank_account_id})
+        rows[transaction_in.transaction_id] = transaction_in.model_dump()
+    
+    # Find the transactions already stored for this account with batched IN queries
+    existing_ids = set()
+    for batch in _batched(list(rows)):
+        existing_ids.update(
+            db.scalars(
+                select(Transaction.transaction_id).where(
+                    Transaction.bank_account_id == bank_account_id,
+                    Transaction.transaction_id.in_(batch)
+                )
+            )
+        )
+    
+    # Insert the rest in a single bulk statement and commit once
+    new_rows = [row for transaction_id, row in rows.items() if transaction_id not in existing_ids]
+    if new_rows:
+        db.execute(insert(Transaction), new_rows)
+    if commit:
+        db.commit()
+    
+    return len(new_rows)
+
+
 def create_or_update_transactions(db: Session, account_id: int, transactions: List[Dict[str, Any]]) -> List[Transaction]:
     """
     Create or update multiple transactions.
@@ -555,23 +876,49 @@ def create_or_update_transactions(db: Session, account_id: int, transactions: Li
     List[Transaction]
         List of created or updated transactions
     """
-    result = []
+    if not transactions:
+        return []
     
+    # Validate the incoming data, keyed by the provider transaction ID
+    rows = {}
     for transaction_data in transactions:
-        # Add the account ID to the transaction data
-        transaction_data["account_id"] = account_id
-        
-        # Create the transaction schema
-        transaction_in = TransactionCreate(**transaction_data)
-        
-        # Check if the transaction already exists
-        existing_transaction = get_transaction_by_transaction_id(db, transaction_id=transaction_in.transaction_id)
-        
-        if existing_transaction:
-            # Update the existing transaction
-            result.append(update_transaction(db, existing_transaction, transaction_in))
-        else:
-            # Create a new transaction
-            result.append(create_transaction(db, transaction_in))
+        transaction_in = TransactionCreate(**{**transaction_data, "bank_account_id": account_id})
+        rows[transaction_in.transaction_id] = transaction_in.model_dump(exclude_unset=True)
+    
+    transaction_ids = list(rows)
+    
+    # Find the transactions already stored for this account with batched IN queries
+    existing_ids = {}
+    for batch in _batched(transaction_ids):
+        existing_ids.update(
+            db.execute(
+                select(Transaction.transaction_id, Transaction.id).where(
+                    Transaction.bank_account_id == account_id,
+                    Transaction.transaction_id.in_(batch)
+                )
+            ).all()
+        )
+    
+    new_rows = [row for transaction_id, row in rows.items() if transaction_id not in existing_ids]
+    updated_rows = [
+        {"id": existing_ids[transaction_id], **row}
+        for transaction_id, row in rows.items()
+        if transaction_id in existing_ids
+    ]
+    
+    # Write all inserts and updates as bulk statements in one commit
+    if new_rows:
+        db.execute(insert(Transaction), new_rows)
+    if updated_rows:
+        db.execute(update(Transaction), updated_rows)
+    db.commit()
     
-    return result
\ No newline at end of file
+    # Return the transactions in input order
+    saved = {}
+    for batch in _batched(transaction_ids):
+        for db_transaction in db.query(Transaction).filter(
+            Transaction.bank_account_id == account_id,
+            Transaction.transaction_id.in_(batch)
+        ):
+            saved[db_transaction.transaction_id] = db_transaction
+    return [saved[transaction_id] for transaction_id in transaction_ids]
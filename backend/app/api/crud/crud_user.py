@@ -1,13 +1,35 @@
 from typing import Any, Dict, Optional, Union, List
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session, defer, load_only, selectinload
 
+from backend.app.core.cache import TTLCache, restore_row, snapshot_row
+from backend.app.core.config import settings
 from backend.app.core.security import get_password_hash, verify_password
 from backend.app.models.user import User
 from backend.app.schemas.user import UserCreate, UserUpdate
 
 
-def get_user(db: Session, user_id: int) -> Optional[User]:
+# Prebuilt statements for the hot single-row lookups, compiled once per process
+# The per-request lookup by ID never needs the password hash, so it is not loaded or cached
+SELECT_USER_BY_ID = (
+    select(User)
+    .options(defer(User.hashed_password))
+    .where(User.id == bindparam("user_id"))
+)
+SELECT_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+SELECT_USER_CREDENTIALS_BY_EMAIL = (
+    select(User)
+    .options(load_only(User.id, User.hashed_password, User.is_active))
+    .where(User.email == bindparam("email"))
+)
+
+# Read-through cache of user rows by ID, hit by every authenticated request
+user_cache = TTLCache(maxsize=5000, ttl=settings.CACHE_TTL_SECONDS)
+
+
+def get_user(db: Session, user_id: int, include_bank_accounts: bool = False) -> Optional[User]:
     """
     Get a user by ID.
     
@@ -17,13 +39,26 @@ def get_user(db: Session, user_id: int) -> Optional[User]:
         Database session
     user_id: int
         User ID
+    include_bank_accounts: bool
+        Eagerly load the user's bank accounts in one extra query
         
     Returns:
     --------
     Optional[User]
         User object if found, None otherwise
     """
-    return db.query(User).filter(User.id == user_id).first()
+    if include_bank_accounts:
+        statement = SELECT_USER_BY_ID.options(selectinload(User.bank_accounts))
+        return db.scalars(statement, {"user_id": user_id}).first()
+    
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return restore_row(db, User, cached)
+    
+    user = db.scalars(SELECT_USER_BY_ID, {"user_id": user_id}).first()
+    if user:
+        user_cache.set(user_id, snapshot_row(user))
+    return user
 
 
 def get_user_by_username(db: Session, username: str) -> Optional[User]:
@@ -42,7 +77,7 @@ def get_user_by_username(db: Session, username: str) -> Optional[User]:
     Optional[User]
         User object if found, None otherwise
     """
-    return db.query(User).filter(User.username == username).first()
+    return db.scalars(SELECT_USER_BY_USERNAME, {"username": username}).first()
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
@@ -61,7 +96,7 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
     Optional[User]
         User object if found, None otherwise
     """
-    return db.query(User).filter(User.email == email).first()
+    return db.scalars(SELECT_USER_BY_EMAIL, {"email": email}).first()
 
 
 def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
@@ -138,7 +173,7 @@ def update_user(db: Session, db_user: User, user_in: Union[UserUpdate, Dict[str,
         Updated user
     """
     # Convert to dict if not already
-    update_data = user_in if isinstance(user_in, dict) else user_in.dict(exclude_unset=True)
+    update_data = user_in if isinstance(user_in, dict) else user_in.model_dump(exclude_unset=True)
     
     # Handle password update
     if "password" in update_data and update_data["password"]:
@@ -154,6 +189,7 @@ def update_user(db: Session, db_user: User, user_in: Union[UserUpdate, Dict[str,
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
+    user_cache.delete(db_user.id)
     
     return db_user
 
@@ -176,7 +212,8 @@ def authenticate(db: Session, email: str, password: str) -> Optional[User]:
     Optional[User]
         User if authentication successful, None otherwise
     """
-    user = get_user_by_email(db, email=email)
+    # Only load the columns needed to check the credentials
+    user = db.scalars(SELECT_USER_CREDENTIALS_BY_EMAIL, {"email": email}).first()
     if not user:
         return None
     if not verify_password(password, user.hashed_password):
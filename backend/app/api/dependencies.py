@@ -1,21 +1,91 @@
-from fastapi import Depends, HTTPException, status
+import hashlib
+import time
+
+import jwt
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from jose import JWTError, jwt
-from datetime import datetime
+from jwt import ExpiredSignatureError, InvalidTokenError
 
 from pydantic import ValidationError
 
+from backend.app.core.cache import TTLCache
 from backend.app.core.config import settings
-from backend.app.core.security import decrypt
 from backend.app.db.base import get_db
 from backend.app.api.crud.crud_user import get_user
 from backend.app.models.user import User
-from backend.app.models.bank import BankAccount
 from backend.app.schemas.token import TokenPayload
 
+class BearerTokenScheme(OAuth2PasswordBearer):
+    """
+    OAuth2 password bearer scheme with a minimal Authorization header parser.
+    
+    The OpenAPI security definition is inherited unchanged.
+    """
+    
+    async def __call__(self, request: Request) -> str:
+        authorization = request.headers.get("authorization", "")
+        if authorization[:7].lower() != "bearer " or len(authorization) == 7:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return authorization[7:]
+
+
 # OAuth2 token URL
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
+oauth2_scheme = BearerTokenScheme(
+    tokenUrl=f"{settings.API_V1_STR}/auth/login", scheme_name="OAuth2PasswordBearer"
+)
+
+# Verified token payloads keyed by the SHA-256 of the raw token
+token_payload_cache = TTLCache(maxsize=10000, ttl=settings.JWT_CACHE_TTL_SECONDS)
+
+
+def decode_token(token: str) -> TokenPayload:
+    """
+    Decode and verify a JWT, reusing the payload of recently verified tokens.
+    
+    Parameters:
+    -----------
+    token: str
+        JWT token
+        
+    Returns:
+    --------
+    TokenPayload
+        The verified token payload
+        
+    Raises:
+    -------
+    InvalidTokenError, ValidationError
+        If the token is invalid
+    """
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    token_data = token_payload_cache.get(key)
+    if token_data is not None:
+        return token_data
+    
+    payload = jwt.decode(
+        token,
+        settings.SECRET_KEY,
+        algorithms=["HS256"],
+        options={"require": ["exp", "sub"]},
+    )
+    
+    # Refresh tokens are only for obtaining new tokens, never for authenticating requests
+    if payload.get("type") == "refresh":
+        raise InvalidTokenError("Refresh token used as an access token")
+    token_data = TokenPayload(**payload)
+    
+    # Only successful decodes are cached, and never past the token's own expiry
+    ttl = token_payload_cache.ttl
+    if token_data.exp is not None:
+        ttl = min(ttl, token_data.exp - time.time() - 2)
+    if ttl > 0:
+        token_payload_cache.set(key, token_data, ttl=ttl)
+    return token_data
 
 
 def get_current_user(
@@ -43,18 +113,15 @@ def get_current_user(
         If authentication fails
     """
     try:
-        # Decode the token
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-        token_data = TokenPayload(**payload)
-        
-        # Check token expiration
-        if datetime.fromtimestamp(token_data.exp) < datetime.utcnow():
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token expired",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    except (JWTError, ValidationError):
+        # Decode the token; jwt.decode also verifies its expiry
+        token_data = decode_token(token)
+    except ExpiredSignatureError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token expired",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except (InvalidTokenError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -69,17 +136,10 @@ def get_current_user(
             detail="User not found",
         )
     
-    # Check if the user is active
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user",
-        )
-    
     return user
 
 
-def get_current_active_user(
+async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
     """
@@ -108,8 +168,8 @@ def get_current_active_user(
     return current_user
 
 
-def get_current_active_superuser(
-    current_user: User = Depends(get_current_user),
+async def get_current_active_superuser(
+    current_user: User = Depends(get_current_active_user),
 ) -> User:
     """
     Get the current active superuser.
@@ -117,7 +177,7 @@ def get_current_active_superuser(
     Parameters:
     -----------
     current_user: User
-        The current authenticated user
+        The current active user
         
     Returns:
     --------
@@ -127,7 +187,7 @@ def get_current_active_superuser(
     Raises:
     -------
     HTTPException
-        If the user is not a superuser
+        If the user is inactive or not a superuser
     """
     if not current_user.is_superuser:
         raise HTTPException(
@@ -135,36 +195,3 @@ def get_current_active_superuser(
             detail="Not enough permissions",
         )
     return current_user
-
-
-def check_bank_account_owner(
-    bank_account: BankAccount,
-    current_user: User = Depends(get_current_user),
-) -> BankAccount:
-    """
-    Check if the current user is the owner of the bank account.
-    
-    Parameters:
-    -----------
-    bank_account: BankAccount
-        The bank account to check
-    current_user: User
-        The current authenticated user
-        
-    Returns:
-    --------
-    BankAccount
-        The bank account if the user is the owner
-        
-    Raises:
-    -------
-    HTTPException
-        If the user is not the owner
-    """
-    if bank_account.user_id != current_user.id and not current_user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-    
-    return bank_account
\ No newline at end of file
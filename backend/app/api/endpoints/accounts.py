@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
@@ -7,30 +7,26 @@ from sqlalchemy.orm import Session
 from backend.app.db.base import get_db
 from backend.app.core.truelayer import (
     get_transactions,
-    transactions_to_dataframe,
     refresh_access_token
 )
-from backend.app.api.dependencies import (
-    get_current_active_user,
-    check_bank_account_owner
-)
+from backend.app.api.dependencies import get_current_active_user
 from backend.app.models.user import User
 from backend.app.models.bank import BankAccount
 from backend.app.schemas.bank import (
     BankAccount as BankAccountSchema,
+    BankAccountBalance as BankAccountBalanceSchema,
     Transaction as TransactionSchema
 )
 
 from backend.app.api.crud.crud_bank import (
-    get_bank_account_by_account_id,
+    get_bank_account_for_user,
     get_decrypted_refresh_token,
     update_bank_account_tokens,
     get_decrypted_access_token,
-    create_transaction,
+    create_missing_transactions,
     get_user_bank_accounts,
     update_last_synced,
-    get_bank_account_by_account_id,
-    get_transactions_by_bank_account
+    get_transaction_rows_by_bank_account
 )
 
 
@@ -57,22 +53,24 @@ def read_bank_accounts(
 def read_bank_account(
     *,
     db: Session = Depends(get_db),
-    account_id: int = Path(...),
+    account_id: str = Path(...),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """
     Get a specific bank account by ID.
     """
-    bank_account = get_bank_account_by_account_id(db=db, account_id=account_id)
+    bank_account = get_bank_account_for_user(
+        db=db,
+        account_id=account_id,
+        user_id=current_user.id,
+        allow_superuser=current_user.is_superuser
+    )
     if not bank_account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Bank account not found",
         )
     
-    # Check if the user is the owner of the bank account
-    check_bank_account_owner(bank_account=bank_account, current_user=current_user)
-    
     return bank_account
 
 
@@ -80,7 +78,7 @@ def read_bank_account(
 def read_transactions(
     *,
     db: Session = Depends(get_db),
-    account_id: int = Path(...),
+    account_id: str = Path(...),
     current_user: User = Depends(get_current_active_user),
     skip: int = 0,
     limit: int = 100,
@@ -92,22 +90,24 @@ def read_transactions(
     If sync=True, it will fetch the latest transactions from TrueLayer.
     """
     # Get the bank account
-    bank_account = get_bank_account_by_account_id(db=db, account_id=account_id)
+    bank_account = get_bank_account_for_user(
+        db=db,
+        account_id=account_id,
+        user_id=current_user.id,
+        allow_superuser=current_user.is_superuser
+    )
     if not bank_account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Bank account not found",
         )
     
-    # Check if the user is the owner of the bank account
-    check_bank_account_owner(bank_account=bank_account, current_user=current_user)
-    
     # Fetch the latest transactions if requested
     if sync:
         # Check if the access token is still valid
         if bank_account.token_expires_at and bank_account.token_expires_at < datetime.utcnow():
             # Refresh the access token
-            refresh_token = get_decrypted_refresh_token(db=db, bank_account_id=bank_account.account_id)
+            refresh_token = get_decrypted_refresh_token(db=db, bank_account_id=bank_account.id)
             token_response = refresh_access_token(refresh_token)
             
             # Check if the token refresh was successful
@@ -121,17 +121,18 @@ def read_transactions(
             access_token = token_response.get("access_token")
             refresh_token = token_response.get("refresh_token")
             expires_in = token_response.get("expires_in")
+            token_expiry = datetime.utcnow() + timedelta(seconds=expires_in) if expires_in else None
             
             update_bank_account_tokens(
                 db=db,
-                db_obj=bank_account,
+                bank_account_id=bank_account.id,
                 access_token=access_token,
                 refresh_token=refresh_token,
-                expires_in=expires_in
+                token_expiry=token_expiry
             )
         else:
             # Use the existing access token
-            access_token = get_decrypted_access_token(db=db, bank_account_id=bank_account.account_id)
+            access_token = get_decrypted_access_token(db=db, bank_account_id=bank_account.id)
         
         # Get transactions from TrueLayer
         from_date = None
@@ -146,54 +147,40 @@ def read_transactions(
             from_date=from_date
         )
         
-        # Save transactions to the database
-        for transaction in transactions:
-            # Check if the transaction already exists
-            existing_transaction = db.query(bank_account.transactions).filter(
-                bank_account.transactions.c.transaction_id == transaction["transaction_id"]
-            ).first()
-            
-            if not existing_transaction:
-                # Create the transaction
-                transaction_in = {
-                    "bank_account_id": bank_account.id,
-                    **transaction
-                }
-                create_transaction(db=db, obj_in=transaction_in)
-        
-        # Update the last synced timestamp
+        # Save the transactions that are not stored yet and update the last synced
+        # timestamp, committing both in one transaction
+        create_missing_transactions(
+            db=db, bank_account_id=bank_account.id, transactions=transactions, commit=False
+        )
         update_last_synced(db=db, db_bank_account=bank_account)
     
-    # Get transactions from the database
-    return get_transactions_by_bank_account(
+    # Get transactions from the database as plain rows; response_model validates them once
+    return get_transaction_rows_by_bank_account(
         db=db, bank_account_id=bank_account.id, skip=skip, limit=limit
     )
 
 
-@router.get("/{account_id}/balance")
+@router.get("/{account_id}/balance", response_model=BankAccountBalanceSchema)
 def read_bank_account_balance(
     *,
     db: Session = Depends(get_db),
-    account_id: int = Path(...),
+    account_id: str = Path(...),
     current_user: User = Depends(get_current_active_user)
-) -> Dict[str, Any]:
+) -> Any:
     """
     Get the balance for a specific bank account.
     """
     # Get the bank account
-    bank_account = get_bank_account_by_account_id(db=db, account_id=account_id)
+    bank_account = get_bank_account_for_user(
+        db=db,
+        account_id=account_id,
+        user_id=current_user.id,
+        allow_superuser=current_user.is_superuser
+    )
     if not bank_account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Bank account not found",
         )
     
-    # Check if the user is the owner of the bank account
-    check_bank_account_owner(bank_account=bank_account, current_user=current_user)
-    
-    return {
-        "balance": bank_account.balance,
-        "available_balance": bank_account.available_balance,
-        "currency": bank_account.currency,
-        "last_synced": bank_account.last_synced
-    }
\ No newline at end of file
+    return bank_account
\ No newline at end of file
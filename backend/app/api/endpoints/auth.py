@@ -7,32 +7,25 @@ from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.app.db.base import get_db
-from backend.app.core.config import settings
-from backend.app.core.security import create_access_token
+from backend.app.db.base import SessionLocal, get_db
+from backend.app.core.security import create_token_pair
 from backend.app.core.truelayer import (
     create_auth_link,
     exchange_auth_code,
-    get_user_info,
     get_accounts,
-    get_account_details,
-    get_account_balance
+    get_accounts_details_and_balances
 )
 from backend.app.api.dependencies import get_current_active_user
 from backend.app.models.user import User
 from backend.app.schemas.token import Token
-from backend.app.schemas.user import UserCreate, UserLogin
+from backend.app.schemas.user import User as UserSchema, UserCreate, UserLogin
 from backend.app.schemas.bank import BankAccountCreate
 from backend.app.api.crud.crud_user import (
     authenticate,
     get_user_by_email,
     create_user,
 )
-from backend.app.api.crud.crud_bank import (
-    get_bank_account_by_account_id,
-    create_bank_account,
-    update_bank_account_tokens
-)
+from backend.app.api.crud.crud_bank import upsert_bank_accounts
 
 router = APIRouter()
 
@@ -62,23 +55,8 @@ def login_access_token(
             detail="Inactive user",
         )
     
-    # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        subject=user.id, expires_delta=access_token_expires
-    )
-    
-    # Create refresh token with longer expiry
-    refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    refresh_token = create_access_token(
-        subject=user.id, expires_delta=refresh_token_expires
-    )
-    
-    return {
-        "access_token": access_token,
-        "refresh_token": refresh_token,
-        "token_type": "bearer"
-    }
+    # Create the access token and the longer-lived refresh token
+    return create_token_pair(user.id)
 
 
 @router.post("/register", response_model=Token)
@@ -100,33 +78,17 @@ def register_user(
     
     # Create the user
     user = create_user(db, user_in=user_in)
-    print(f"User created: {user}")
-    # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        subject=user.id, expires_delta=access_token_expires
-    )
-    # Create refresh token
-    refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    refresh_token = create_access_token(
-        subject=user.id, expires_delta=refresh_token_expires
-    )
-    
-    return {
-        "access_token": access_token,
-        "refresh_token": refresh_token,
-        "token_type": "bearer"
-    }
+    # Create the access token and the longer-lived refresh token
+    return create_token_pair(user.id)
 
 
 @router.get("/truelayer/authorize")
-def authorize_truelayer(
+async def authorize_truelayer(
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, str]:
     """
     Get a TrueLayer authorization URL for the user to connect their bank account.
     """
-    print(f"User: {current_user}")
     # Generate a state parameter to verify the callback
     state = str(uuid.uuid4())
     
@@ -140,7 +102,7 @@ def authorize_truelayer(
 
 
 @router.get("/truelayer/callback")
-async def truelayer_callback(
+def truelayer_callback(
     request: Request,
     code: str = Query(None),
     state: str = Query(None),
@@ -156,6 +118,11 @@ async def truelayer_callback(
             detail="Authorization code not provided",
         )
     
+    # End the read transaction used to load the user so its pooled connection is not
+    # held while waiting on TrueLayer; the session itself stays open for get_db
+    user_id = current_user.id
+    db.rollback()
+    
     # Exchange the authorization code for an access token
     token_response = exchange_auth_code(code)
     
@@ -176,42 +143,38 @@ async def truelayer_callback(
             detail="Access token or refresh token not provided",
         )
     
-    # Get user information from TrueLayer
-    user_info = get_user_info(access_token)
-    
     # Get the user's bank accounts
     accounts = get_accounts(access_token)
     
-    # Save each account to the database
+    # Get the details and balance of every account concurrently
+    account_data = get_accounts_details_and_balances(
+        access_token, [account.get("account_id") for account in accounts]
+    )
+    
+    # Token expiry reported by TrueLayer
+    expires_in = token_response.get("expires_in")
+    token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in) if expires_in else None
+    
+    # Prepare the data of each account
+    accounts_in = []
     for account in accounts:
-        # Check if the account already exists
         account_id = account.get("account_id")
-        existing_account = get_bank_account_by_account_id(db, account_id)
         
         # Get account details and balance
-        account_details = get_account_details(access_token, account_id)
-        account_balance = get_account_balance(access_token, account_id)
+        account_details, account_balance = account_data[account_id]
         
         # Prepare account data
         account_name = account.get("display_name", "")
         institution = account_details.get("provider", {}).get("display_name", "")
         currency = account_details.get("currency", "")
-        balance = float(account_balance.get("current", 0))
-        available_balance = float(account_balance.get("available", 0))
+        # BankAccountCreate coerces the balances to float during validation
+        balance = account_balance.get("current", 0)
+        available_balance = account_balance.get("available", 0)
         account_type = account.get("account_type", "")
         
-        if existing_account:
-            # Update the existing account
-            update_bank_account_tokens(
-                db=db,
-                db_obj=existing_account,
-                access_token=access_token,
-                refresh_token=refresh_token
-            )
-        else:
-            # Create a new account
-            account_in = BankAccountCreate(
-                user_id=current_user.id,
+        accounts_in.append(
+            BankAccountCreate(
+                user_id=user_id,
                 account_id=account_id,
                 account_name=account_name,
                 institution=institution,
@@ -220,29 +183,26 @@ async def truelayer_callback(
                 available_balance=available_balance,
                 account_type=account_type,
                 access_token=access_token,
-                refresh_token=refresh_token
+                refresh_token=refresh_token,
+                token_expires_at=token_expires_at
             )
-            create_bank_account(db=db, obj_in=account_in)
+        )
+    
+    # Create new accounts and refresh existing ones in a single statement, on a
+    # short-lived session that only holds a connection for the write
+    with SessionLocal() as write_db:
+        upsert_bank_accounts(write_db, accounts_in)
     
     # Redirect to the frontend
     frontend_url = "/"  # Replace with the actual frontend URL
     return RedirectResponse(url=frontend_url)
 
 
-@router.get("/me", response_model=Dict[str, Any])
-def read_current_user(
+@router.get("/me", response_model=UserSchema)
+async def read_current_user(
     current_user: User = Depends(get_current_active_user),
-) -> Dict[str, Any]:
+) -> Any:
     """
     Get information about the current user.
     """
-    return {
-        "id": current_user.id,
-        "username": current_user.username,
-        "email": current_user.email,
-        "full_name": current_user.full_name,
-        "is_active": current_user.is_active,
-        "is_superuser": current_user.is_superuser,
-        "created_at": current_user.created_at,
-        "updated_at": current_user.updated_at
-    }
\ No newline at end of file
+    return current_user
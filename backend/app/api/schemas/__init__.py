@@ -1 +0,0 @@
-# Initialize the schemas package
\ No newline at end of file
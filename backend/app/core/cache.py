@@ -0,0 +1,148 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Type, TypeVar
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+
+ModelType = TypeVar("ModelType")
+
+
+class TTLCache:
+    """
+    Thread-safe in-process LRU cache with per-entry expiry.
+
+    Attributes:
+    -----------
+    maxsize: int
+        Maximum number of entries kept before the least recently used is evicted
+    ttl: float
+        Default time to live of an entry in seconds
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Parameters:
+        -----------
+        key: Hashable
+            Cache key
+        default: Any
+            Value returned when the key is missing or expired
+
+        Returns:
+        --------
+        Any
+            Cached value or default
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Parameters:
+        -----------
+        key: Hashable
+            Cache key
+        value: Any
+            Value to cache
+        ttl: Optional[float]
+            Time to live in seconds, defaults to the cache TTL
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove a value if present.
+
+        Parameters:
+        -----------
+        key: Hashable
+            Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            self._data.clear()
+
+
+def snapshot_row(obj: Any) -> Dict[str, Any]:
+    """
+    Copy the loaded column values of an ORM object into a plain dict.
+
+    Deferred or expired columns are left out and load on access once restored.
+
+    Parameters:
+    -----------
+    obj: Any
+        ORM object
+
+    Returns:
+    --------
+    Dict[str, Any]
+        Column values keyed by attribute name
+    """
+    state = inspect(obj)
+    return {
+        attr.key: getattr(obj, attr.key)
+        for attr in state.mapper.column_attrs
+        if attr.key not in state.unloaded
+    }
+
+
+def restore_row(db: Session, model: Type[ModelType], values: Dict[str, Any]) -> ModelType:
+    """
+    Attach a cached row snapshot to a session without querying the database.
+
+    An instance already loaded in the session is returned as is, so a stale
+    snapshot never overwrites fresher state.
+
+    Parameters:
+    -----------
+    db: Session
+        Database session
+    model: Type[ModelType]
+        ORM model class
+    values: Dict[str, Any]
+        Column values produced by snapshot_row
+
+    Returns:
+    --------
+    ModelType
+        Persistent ORM object belonging to the session
+    """
+    primary_key = tuple(values[column.key] for column in inspect(model).primary_key)
+    existing = db.identity_map.get(identity_key(model, primary_key))
+    if existing is not None:
+        return existing
+    
+    obj = model(**values)
+    make_transient_to_detached(obj)
+    return db.merge(obj, load=False)
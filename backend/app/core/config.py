@@ -15,6 +15,7 @@ class Settings(BaseSettings):
     ENCRYPTION_KEY: str = secrets.token_urlsafe(24)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30  # 30 days
+    BCRYPT_ROUNDS: int = 12  # each extra round doubles the hashing cost
 
 
     # Backend URL
@@ -28,6 +29,16 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./finance_app.db"
+    # 20 + 30 connections covers every thread of FastAPI's default 40-thread pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 30  # seconds
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    
+    # In-process read cache
+    CACHE_TTL_SECONDS: int = 30
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+    JWT_CACHE_TTL_SECONDS: int = 30
     
     # TrueLayer configuration
     TRUELAYER_CLIENT_ID: Optional[str] = None
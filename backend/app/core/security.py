@@ -1,17 +1,25 @@
 import base64
 import os
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union
+from typing import Any, Dict, Optional, Union
 
-from jose import jwt
+import jwt
 from passlib.context import CryptContext
 from cryptography.fernet import Fernet
 
+try:
+    # Rust-backed Fernet, wire-compatible with cryptography's implementation
+    from rfernet import Fernet as RFernet
+except ImportError:
+    RFernet = None
+
 from backend.app.core.config import settings
 
 
 # Password context for hashing and verifying passwords
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], bcrypt__rounds=settings.BCRYPT_ROUNDS, deprecated="auto"
+)
 
 # Secret key for token 
 SECRET_KEY = settings.SECRET_KEY
@@ -31,7 +39,12 @@ elif len(encryption_key) > 32:
 
 # Create a valid Fernet key (url-safe base64-encoded)
 fernet_key = base64.urlsafe_b64encode(encryption_key)
-fernet = Fernet(fernet_key)
+
+# Prefer rfernet when installed; it works on str tokens where cryptography uses bytes
+if RFernet is not None:
+    fernet = RFernet(fernet_key.decode("ascii"))
+else:
+    fernet = Fernet(fernet_key)
 
 
 def create_access_token(
@@ -64,6 +77,34 @@ def create_access_token(
     return encoded_jwt
 
 
+def create_token_pair(subject: Union[str, Any]) -> Dict[str, str]:
+    """
+    Create an access token and a longer-lived refresh token for the same subject.
+    
+    Parameters:
+    -----------
+    subject: Union[str, Any]
+        Token subject
+        
+    Returns:
+    --------
+    Dict[str, str]
+        Dictionary with access_token, refresh_token and token_type
+    """
+    # The refresh token is marked so it is never accepted as an access token
+    refresh_claims = {
+        "exp": datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        "sub": str(subject),
+        "type": "refresh",
+    }
+    
+    return {
+        "access_token": create_access_token(subject),
+        "refresh_token": jwt.encode(refresh_claims, SECRET_KEY, algorithm=ALGORITHM),
+        "token_type": "bearer"
+    }
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify password.
@@ -114,21 +155,25 @@ def encrypt(data: str) -> bytes:
     bytes
         Encrypted data
     """
+    if RFernet is not None:
+        return fernet.encrypt(data.encode("utf-8")).encode("ascii")
     return fernet.encrypt(data.encode("utf-8"))
 
 
-def decrypt(data: bytes) -> str:
+def decrypt(data: Union[bytes, str]) -> str:
     """
     Decrypt data.
     
     Parameters:
     -----------
-    data: bytes
-        Data to decrypt
+    data: Union[bytes, str]
+        Data to decrypt; str is accepted for tokens stored before the columns became binary
         
     Returns:
     --------
     str
         Decrypted data
     """
-    return fernet.decrypt(data).decode("utf-8")
\ No newline at end of file
+    if RFernet is not None:
+        return fernet.decrypt(data.decode("ascii") if isinstance(data, bytes) else data).decode("utf-8")
+    return fernet.decrypt(data).decode("utf-8")
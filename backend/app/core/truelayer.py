@@ -1,9 +1,13 @@
-import requests
+import atexit
 import json
-from typing import Dict, List, Optional, Any
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-import pandas as pd
-import requests, urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+
 from backend.app.core.config import settings
 
 # TrueLayer API endpoints
@@ -11,6 +15,19 @@ AUTH_URL = "https://auth.truelayer.com"
 API_URL = "https://api.truelayer.com"
 DATA_API_URL = f"{API_URL}/data/v1"
 
+# Timeout for TrueLayer API calls in seconds
+REQUEST_TIMEOUT = 10
+
+# Shared session so TrueLayer calls reuse keep-alive connections instead of
+# doing a new TCP + TLS handshake per request
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=50))
+atexit.register(session.close)
+
+# Worker threads for fanning out independent per-account calls
+executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="truelayer")
+atexit.register(executor.shutdown, wait=False)
+
 
 def create_auth_link(state: str) -> str:
     """
@@ -63,7 +80,7 @@ def exchange_auth_code(code: str) -> Dict[str, Any]:
         "redirect_uri": settings.TRUELAYER_REDIRECT_URI
     }
     
-    response = requests.post(f"{AUTH_URL}/connect/token", data=data)
+    response = session.post(f"{AUTH_URL}/connect/token", data=data, timeout=REQUEST_TIMEOUT)
     
     if response.status_code != 200:
         return {"error": response.text}
@@ -92,7 +109,7 @@ def refresh_access_token(refresh_token: str) -> Dict[str, Any]:
         "grant_type": "refresh_token"
     }
     
-    response = requests.post(f"{AUTH_URL}/connect/token", data=data)
+    response = session.post(f"{AUTH_URL}/connect/token", data=data, timeout=REQUEST_TIMEOUT)
     
     if response.status_code != 200:
         return {"error": response.text}
@@ -118,7 +135,7 @@ def get_user_info(access_token: str) -> Dict[str, Any]:
         "Authorization": f"Bearer {access_token}"
     }
     
-    response = requests.get(f"{DATA_API_URL}/info", headers=headers)
+    response = session.get(f"{DATA_API_URL}/info", headers=headers, timeout=REQUEST_TIMEOUT)
     
     if response.status_code != 200:
         return {"error": response.text}
@@ -144,7 +161,7 @@ def get_accounts(access_token: str) -> List[Dict[str, Any]]:
         "Authorization": f"Bearer {access_token}"
     }
     
-    response = requests.get(f"{DATA_API_URL}/accounts", headers=headers)
+    response = session.get(f"{DATA_API_URL}/accounts", headers=headers, timeout=REQUEST_TIMEOUT)
     
     if response.status_code != 200:
         return []
@@ -172,7 +189,7 @@ def get_account_details(access_token: str, account_id: str) -> Dict[str, Any]:
         "Authorization": f"Bearer {access_token}"
     }
     
-    response = requests.get(f"{DATA_API_URL}/accounts/{account_id}", headers=headers)
+    response = session.get(f"{DATA_API_URL}/accounts/{account_id}", headers=headers, timeout=REQUEST_TIMEOUT)
     
     if response.status_code != 200:
         return {}
@@ -200,7 +217,7 @@ def get_account_balance(access_token: str, account_id: str) -> Dict[str, Any]:
         "Authorization": f"Bearer {access_token}"
     }
     
-    response = requests.get(f"{DATA_API_URL}/accounts/{account_id}/balance", headers=headers)
+    response = session.get(f"{DATA_API_URL}/accounts/{account_id}/balance", headers=headers, timeout=REQUEST_TIMEOUT)
     
     if response.status_code != 200:
         return {}
@@ -208,6 +225,39 @@ def get_account_balance(access_token: str, account_id: str) -> Dict[str, Any]:
     return response.json().get("results", [])[0] if response.json().get("results") else {}
 
 
+def get_accounts_details_and_balances(
+    access_token: str, account_ids: List[str]
+) -> Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Get details and balances for several accounts from TrueLayer concurrently.
+    
+    Parameters:
+    -----------
+    access_token: str
+        Access token
+    account_ids: List[str]
+        Account IDs
+        
+    Returns:
+    --------
+    Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]
+        Account details and balance, keyed by account ID
+    """
+    details = {
+        account_id: executor.submit(get_account_details, access_token, account_id)
+        for account_id in account_ids
+    }
+    balances = {
+        account_id: executor.submit(get_account_balance, access_token, account_id)
+        for account_id in account_ids
+    }
+    
+    return {
+        account_id: (details[account_id].result(), balances[account_id].result())
+        for account_id in account_ids
+    }
+
+
 def get_transactions(
     access_token: str, 
     account_id: str, 
@@ -245,7 +295,7 @@ def get_transactions(
     if to_date:
         params["to"] = to_date
     
-    response = requests.get(url, headers=headers, params=params)
+    response = session.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
     
     if response.status_code != 200:
         return []
@@ -270,30 +320,3 @@ def get_transactions(
         processed_transactions.append(processed_tx)
     
     return processed_transactions
-
-
-def transactions_to_dataframe(transactions: List[Dict[str, Any]]) -> pd.DataFrame:
-    """
-    Convert a list of transactions to a pandas DataFrame.
-    
-    Parameters:
-    -----------
-    transactions: List[Dict[str, Any]]
-        List of transactions
-        
-    Returns:
-    --------
-    pd.DataFrame
-        Pandas DataFrame
-    """
-    df = pd.DataFrame(transactions)
-    
-    # Convert timestamp to datetime
-    if "timestamp" in df.columns:
-        df["date"] = pd.to_datetime(df["timestamp"])
-    
-    # Convert amount to float
-    if "amount" in df.columns:
-        df["amount"] = df["amount"].astype(float)
-    
-    return df
\ No newline at end of file
@@ -5,9 +5,33 @@ from sqlalchemy.orm import sessionmaker
 from backend.app.core.config import settings
 
 
+database_url = sqlalchemy.engine.make_url(settings.DATABASE_URL)
+
+# SQLite connections are shared across FastAPI's worker threads
+connect_args = {"check_same_thread": False} if database_url.get_backend_name() == "sqlite" else {}
+
+# In-memory SQLite uses a SingletonThreadPool, which has no overflow, timeout or LIFO
+# options; every other URL gets a QueuePool sized for concurrent requests
+pool_args = {}
+if not (
+    database_url.get_backend_name() == "sqlite"
+    and (database_url.database in (None, "", ":memory:") or database_url.query.get("mode") == "memory")
+):
+    pool_args = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        # Reuse the most recently returned connection so idle extras can time out
+        "pool_use_lifo": True,
+    }
+
 # Create database engine
 engine = sqlalchemy.create_engine(
-    settings.DATABASE_URL, connect_args={"check_same_thread": False}
+    settings.DATABASE_URL,
+    connect_args=connect_args,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    **pool_args,
 )
 
 # Create session for database operations
@@ -26,8 +50,5 @@ def get_db():
     Session
         Database session
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+    with SessionLocal() as db:
+        yield db
\ No newline at end of file
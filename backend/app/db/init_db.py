@@ -18,6 +18,12 @@ def init_db(db: Session) -> None:
     # Create tables
     Base.metadata.create_all(bind=engine)
     
+    # create_all skips tables that already exist, so add any model indexes that an
+    # older database is missing (e.g. the unique (user_id, account_id) upsert target)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    
     # Check if we need to create a superuser
     user = get_user_by_email(db, email="admin@example.com")
     if not user:
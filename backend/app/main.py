@@ -45,7 +45,7 @@ async def startup_event():
 
 
 @app.get("/")
-def root():
+async def root():
     """
     Root endpoint that returns a welcome message.
     """
@@ -85,4 +85,6 @@ if __name__ == "__main__":
     host="0.0.0.0" if settings.SERVER_HOST == "localhost" else settings.SERVER_HOST,
     port=settings.SERVER_PORT,
     reload=settings.DEBUG,
+    # Per-request access logging is only useful while developing
+    access_log=settings.DEBUG,
 )
\ No newline at end of file
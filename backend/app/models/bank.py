@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Boolean, Column, Integer, String, Float, DateTime, ForeignKey, Index, Text, LargeBinary
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -29,9 +29,9 @@ class BankAccount(Base):
         Current balance
     available_balance: float
         Available balance
-    access_token: str
+    access_token: bytes
         Encrypted access token
-    refresh_token: str
+    refresh_token: bytes
         Encrypted refresh token
     token_expires_at: datetime
         Token expiration timestamp
@@ -55,8 +55,14 @@ class BankAccount(Base):
     currency = Column(String, nullable=False)
     balance = Column(Float, nullable=False, default=0.0)
     available_balance = Column(Float, nullable=True)
-    access_token = Column(Text, nullable=False)
-    refresh_token = Column(Text, nullable=False)
+    # Fernet ciphertext stored as bytes. Databases created while these columns were
+    # Text need them converted, e.g. on PostgreSQL:
+    #   ALTER TABLE bank_accounts ALTER COLUMN access_token TYPE BYTEA
+    #       USING convert_to(access_token, 'UTF8');
+    # (and the same for refresh_token). SQLite needs no change; decrypt() also
+    # accepts str values read back from such rows.
+    access_token = Column(LargeBinary, nullable=False)
+    refresh_token = Column(LargeBinary, nullable=False)
     token_expires_at = Column(DateTime, nullable=True)
     last_synced = Column(DateTime, nullable=True)
     is_active = Column(Boolean, default=True)
@@ -121,4 +127,18 @@ class Transaction(Base):
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    bank_account = relationship("BankAccount", back_populates="transactions")
\ No newline at end of file
+    bank_account = relationship("BankAccount", back_populates="transactions")
+
+
+# Composite indexes for the per-user account listing and the per-account
+# transaction history (newest first)
+Index("ix_bank_accounts_user_id_id", BankAccount.user_id, BankAccount.id)
+Index("ix_transactions_bank_account_id_date", Transaction.bank_account_id, Transaction.date.desc())
+
+# A TrueLayer account is linked at most once per user; this is the upsert conflict target
+Index(
+    "uq_bank_accounts_user_id_account_id",
+    BankAccount.user_id,
+    BankAccount.account_id,
+    unique=True,
+)
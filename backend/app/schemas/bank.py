@@ -1,7 +1,7 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class BankAccountBase(BaseModel):
@@ -18,6 +18,7 @@ class BankAccountBase(BaseModel):
 
 class BankAccountCreate(BankAccountBase):
     """Bank account creation schema"""
+    user_id: int
     account_id: str
     account_name: str
     institution: str
@@ -46,8 +47,7 @@ class BankAccountInDBBase(BankAccountBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BankAccount(BankAccountInDBBase):
@@ -55,6 +55,16 @@ class BankAccount(BankAccountInDBBase):
     pass
 
 
+class BankAccountBalance(BaseModel):
+    """Bank account balance schema (returned to client)"""
+    balance: Optional[float] = None
+    available_balance: Optional[float] = None
+    currency: Optional[str] = None
+    last_synced: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class BankAccountInDB(BankAccountInDBBase):
     """Bank account in DB schema (with sensitive fields)"""
     access_token: str
@@ -97,8 +107,7 @@ class TransactionInDBBase(TransactionBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Transaction(TransactionInDBBase):
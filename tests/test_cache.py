@@ -0,0 +1,50 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.cache import restore_row, snapshot_row
+from backend.app.db.base import Base
+from backend.app.models.user import User
+
+
+def test_restore_row_keeps_instances_already_in_the_session():
+    """A cached snapshot never overwrites a row the session has already loaded."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    with Session() as db:
+        db.add(User(email="user@example.com", username="user", hashed_password="hashed"))
+        db.commit()
+        snapshot = snapshot_row(db.get(User, 1))
+
+    with Session() as db:
+        db.query(User).filter(User.id == 1).update({"full_name": "Fresh"})
+        db.commit()
+        user = db.get(User, 1)
+
+        restored = restore_row(db, User, snapshot)
+
+        assert restored is user
+        assert restored.full_name == "Fresh"
+        assert not db.dirty
+
+
+def test_restore_row_attaches_snapshot_without_querying():
+    """A cache hit on a fresh session issues no SQL."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    with Session() as db:
+        db.add(User(email="user@example.com", username="user", hashed_password="hashed"))
+        db.commit()
+        snapshot = snapshot_row(db.get(User, 1))
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    with Session() as db:
+        restored = restore_row(db, User, snapshot)
+
+        assert restored.email == "user@example.com"
+        assert restored in db
+        assert statements == []
@@ -0,0 +1,194 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.api.crud import crud_bank
+from backend.app.api.crud.crud_bank import (
+    IN_CLAUSE_BATCH_SIZE,
+    create_missing_transactions,
+    create_or_update_transactions,
+    get_bank_account_for_user,
+    upsert_bank_accounts,
+)
+from backend.app.db.base import Base
+from backend.app.models.bank import BankAccount, Transaction
+from backend.app.models.user import User
+from backend.app.schemas.bank import BankAccountCreate
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def make_account(db, username, account_id="acc-1"):
+    user = User(email=f"{username}@example.com", username=username, hashed_password="hashed")
+    account = BankAccount(
+        user=user,
+        account_id=account_id,
+        account_name="Current",
+        institution="Bank",
+        currency="GBP",
+        access_token=b"access",
+        refresh_token=b"refresh",
+    )
+    db.add(account)
+    db.flush()
+    return account
+
+
+def make_transaction(transaction_id, amount):
+    return {
+        "transaction_id": transaction_id,
+        "transaction_category": "PURCHASE",
+        "date": datetime(2024, 1, 1),
+        "description": "new",
+        "amount": amount,
+    }
+
+
+def test_create_missing_transactions_skips_existing_rows(db):
+    """Only unseen transaction IDs are inserted, across several IN batches, and stored rows stay as they were."""
+    account = make_account(db, "user")
+
+    # Every third ID of the incoming batch is already stored, spread over more than one IN batch
+    total = IN_CLAUSE_BATCH_SIZE * 2 + 50
+    existing_ids = [f"tx-{i}" for i in range(0, total, 3)]
+    for transaction_id in existing_ids:
+        db.add(Transaction(
+            bank_account_id=account.id,
+            transaction_id=transaction_id,
+            transaction_category="TRANSFER",
+            date=datetime(2023, 6, 1),
+            description="stored",
+            amount=-1.0,
+        ))
+    db.commit()
+
+    incoming = [make_transaction(f"tx-{i}", float(i)) for i in range(total)]
+    inserted = create_missing_transactions(db, account.id, incoming)
+
+    assert inserted == total - len(existing_ids)
+
+    rows = db.execute(
+        select(Transaction.transaction_id, Transaction.description, Transaction.amount, Transaction.date)
+    ).all()
+    assert len(rows) == total
+    by_id = {row.transaction_id: row for row in rows}
+    for transaction_id in existing_ids:
+        row = by_id[transaction_id]
+        assert (row.description, row.amount, row.date) == ("stored", -1.0, datetime(2023, 6, 1))
+    assert by_id["tx-1"].description == "new"
+    assert by_id["tx-1"].amount == 1.0
+
+    # Running the same sync again inserts nothing
+    assert create_missing_transactions(db, account.id, incoming) == 0
+
+
+def test_create_or_update_transactions_stays_within_the_account(db):
+    """A sync only updates its own account's rows, even when another account shares provider IDs."""
+    first = make_account(db, "first")
+    second = make_account(db, "second")
+    db.commit()
+
+    create_or_update_transactions(db, first.id, [make_transaction("tx-1", 1.0)])
+    saved = create_or_update_transactions(db, second.id, [make_transaction("tx-1", 2.0)])
+
+    assert [(t.bank_account_id, t.amount) for t in saved] == [(second.id, 2.0)]
+    rows = db.execute(
+        select(Transaction.bank_account_id, Transaction.amount).order_by(Transaction.id)
+    ).all()
+    assert rows == [(first.id, 1.0), (second.id, 2.0)]
+
+    # Syncing the first account again updates its row in place
+    saved = create_or_update_transactions(db, first.id, [make_transaction("tx-1", 3.0)])
+    assert [(t.id, t.amount) for t in saved] == [(1, 3.0)]
+
+
+@pytest.fixture(params=["on_conflict", "lookup"])
+def upsert_path(request, monkeypatch):
+    """Run upsert tests on the ON CONFLICT statement and on the lookup fallback."""
+    if request.param == "lookup":
+        monkeypatch.delitem(crud_bank.UPSERT_INSERTS, "sqlite")
+    return request.param
+
+
+def make_bank_account_in(user_id, account_id="acc-1", balance=10.0):
+    return BankAccountCreate(
+        user_id=user_id,
+        account_id=account_id,
+        account_name="Current",
+        institution="Bank",
+        currency="GBP",
+        balance=balance,
+        access_token="access",
+        refresh_token="refresh",
+    )
+
+
+def make_user(db, username):
+    user = User(email=f"{username}@example.com", username=username, hashed_password="hashed")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_upsert_bank_accounts_relink_updates_in_place(db, upsert_path):
+    """Linking the same TrueLayer account again refreshes the existing row."""
+    user = make_user(db, "user")
+
+    first = upsert_bank_accounts(db, [make_bank_account_in(user.id, balance=10.0)])
+    second = upsert_bank_accounts(db, [make_bank_account_in(user.id, balance=25.0)])
+
+    assert [account.id for account in second] == [first[0].id]
+    rows = db.execute(select(BankAccount.user_id, BankAccount.account_id, BankAccount.balance)).all()
+    assert rows == [(user.id, "acc-1", 25.0)]
+
+
+def test_upsert_bank_accounts_keeps_accounts_per_user(db, upsert_path):
+    """Two users linking the same TrueLayer account each get their own row."""
+    first_user = make_user(db, "first")
+    second_user = make_user(db, "second")
+
+    upsert_bank_accounts(db, [make_bank_account_in(first_user.id, balance=10.0)])
+    upsert_bank_accounts(db, [make_bank_account_in(second_user.id, balance=20.0)])
+
+    rows = db.execute(
+        select(BankAccount.user_id, BankAccount.account_id, BankAccount.balance).order_by(BankAccount.id)
+    ).all()
+    assert rows == [(first_user.id, "acc-1", 10.0), (second_user.id, "acc-1", 20.0)]
+
+
+def test_upsert_bank_accounts_collapses_repeated_accounts(db, upsert_path):
+    """An account listed twice in one response is written once, with the last values."""
+    user = make_user(db, "user")
+
+    bank_accounts = upsert_bank_accounts(db, [
+        make_bank_account_in(user.id, balance=10.0),
+        make_bank_account_in(user.id, account_id="acc-2"),
+        make_bank_account_in(user.id, balance=30.0),
+    ])
+
+    assert len(bank_accounts) == 2
+    rows = db.execute(
+        select(BankAccount.account_id, BankAccount.balance).order_by(BankAccount.account_id)
+    ).all()
+    assert rows == [("acc-1", 30.0), ("acc-2", 10.0)]
+
+
+def test_get_bank_account_for_user_resolves_shared_accounts(db):
+    """A superuser gets their own link of a shared account, otherwise the earliest one."""
+    first = make_account(db, "first")
+    second = make_account(db, "second")
+    outsider = make_user(db, "outsider")
+
+    assert get_bank_account_for_user(db, "acc-1", second.user_id, allow_superuser=True).id == second.id
+    assert get_bank_account_for_user(db, "acc-1", outsider.id, allow_superuser=True).id == first.id
+    assert get_bank_account_for_user(db, "acc-1", outsider.id) is None
@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("database_url, pool", [
+    ("sqlite://", "SingletonThreadPool"),
+    ("sqlite:///:memory:", "SingletonThreadPool"),
+    ("sqlite:///{tmp}/app.db", "QueuePool"),
+])
+def test_engine_accepts_sqlite_urls(tmp_path, database_url, pool):
+    """The engine is created for in-memory and file SQLite URLs, with a QueuePool only for files."""
+    env = {**os.environ, "DATABASE_URL": database_url.format(tmp=tmp_path)}
+    result = subprocess.run(
+        [sys.executable, "-c", "from backend.app.db.base import engine; print(type(engine.pool).__name__)"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == pool
@@ -0,0 +1,39 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.api.dependencies import get_current_user
+from backend.app.core.security import create_token_pair
+from backend.app.db.base import Base
+from backend.app.models.user import User
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(email="user@example.com", username="user", hashed_password="hashed"))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_get_current_user_accepts_access_token(db):
+    """The access token of a pair authenticates its user."""
+    tokens = create_token_pair(1)
+
+    assert get_current_user(db=db, token=tokens["access_token"]).id == 1
+
+
+def test_get_current_user_rejects_refresh_token(db):
+    """A refresh token cannot be used to authenticate a request."""
+    tokens = create_token_pair(1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        get_current_user(db=db, token=tokens["refresh_token"])
+
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.headers == {"WWW-Authenticate": "Bearer"}
@@ -0,0 +1,39 @@
+import pytest
+from cryptography.fernet import Fernet
+
+from backend.app.core import security
+
+rfernet = pytest.importorskip("rfernet")
+
+
+def test_rfernet_decrypts_cryptography_tokens():
+    """Tokens written by cryptography.Fernet can be read back with rfernet."""
+    key = Fernet.generate_key()
+    token = Fernet(key).encrypt(b"access-token")
+
+    assert rfernet.Fernet(key.decode("ascii")).decrypt(token.decode("ascii")) == b"access-token"
+
+
+def test_cryptography_decrypts_rfernet_tokens():
+    """Tokens written by rfernet can be read back with cryptography.Fernet."""
+    key = Fernet.generate_key()
+    token = rfernet.Fernet(key.decode("ascii")).encrypt(b"refresh-token")
+
+    assert Fernet(key).decrypt(token.encode("ascii")) == b"refresh-token"
+
+
+def test_decrypt_reads_tokens_stored_by_cryptography():
+    """Ciphertext stored before the switch to rfernet still decrypts, as bytes or str."""
+    token = Fernet(security.fernet_key).encrypt(b"stored-token")
+
+    assert security.decrypt(token) == "stored-token"
+    assert security.decrypt(token.decode("ascii")) == "stored-token"
+
+
+def test_encrypt_decrypt_round_trip():
+    """encrypt returns bytes that decrypt turns back into the original string."""
+    ciphertext = security.encrypt("round-trip")
+
+    assert isinstance(ciphertext, bytes)
+    assert security.decrypt(ciphertext) == "round-trip"
+    assert Fernet(security.fernet_key).decrypt(ciphertext) == b"round-trip"